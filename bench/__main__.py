@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import json
+
+from bench.harness import run
+
+ALL_SCENARIOS = ["start", "menu", "bonus", "next", "next5", "payment", "redeem", "broadcast"]
+
+
+def add_backend_args(p: argparse.ArgumentParser):
+    """Fake Telegram / Mongo options, shared with `python -m bench.replay`."""
+    p.add_argument("--content", type=int, default=5_000, help="seeded content items")
+    p.add_argument("--tg-latency-ms", type=float, default=30.0)
+    p.add_argument("--tg-jitter-ms", type=float, default=10.0)
+    p.add_argument("--db-latency-ms", type=float, default=2.0)
+    p.add_argument("--flood-rate", type=float, default=0.0, help="FloodWait probability per send")
+    p.add_argument("--flood-seconds", type=int, default=1)
+    p.add_argument("--broadcast-rate", type=float, default=1000.0)
+    p.add_argument("--helpers", type=int, default=0, help="extra sender bots in the pool")
+    p.add_argument("--sender-rate", type=float, default=1000.0, help="msgs/sec per bot token")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--json", dest="json_path", help="write machine-readable results here")
+
+
+def parse_args(argv=None) -> dict:
+    p = argparse.ArgumentParser(prog="python -m bench", description="bot.py load test")
+    p.add_argument("--users", type=int, default=10_000, help="seeded users")
+    p.add_argument("--updates", type=int, default=5_000, help="updates per scenario")
+    p.add_argument("--concurrency", type=int, default=200, help="concurrent virtual users")
+    p.add_argument("--scenarios", default=",".join(ALL_SCENARIOS))
+    add_backend_args(p)
+    args = p.parse_args(argv)
+
+    config = vars(args).copy()
+    config["scenarios"] = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    return config
+
+
+def print_table(results: dict):
+    print(f"{'scenario':<10} {'updates':>8} {'upd/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+          f"{'db/upd':>7} {'tg/upd':>7} {'errors':>6}")
+    for name, r in results["scenarios"].items():
+        lat = r["latency_ms"]
+        print(f"{name:<10} {r['updates']:>8} {r['updates_per_sec'] or 0:>10.1f} "
+              f"{lat['p50']:>9.2f} {lat['p99']:>9.2f} {r['db_ops_per_update']:>7.2f} "
+              f"{r['tg_calls_per_update']:>7.2f} {r['errors']:>6}")
+
+
+def main(argv=None):
+    config = parse_args(argv)
+    json_path = config.pop("json_path")
+    results = asyncio.run(run(config))
+    print_table(results)
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"results written to {json_path}")
+
+
+if __name__ == "__main__":
+    main()
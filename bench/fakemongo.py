@@ -0,0 +1,766 @@
+"""
+Minimal in-process stand-in for pymongo's AsyncMongoClient.
+
+Implements the subset of the async collection API that bot.py uses, with
+an optional per-operation latency and per-collection op counters. Single
+field indexes declared through create_indexes() are kept as hash indexes
+so equality lookups stay O(1) at 100k+ documents; everything else scans.
+"""
+
+import asyncio
+import copy
+from collections import Counter
+from types import SimpleNamespace
+
+from bson.objectid import ObjectId
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+MISSING = object()
+
+
+# ---------------------------
+# PATHS + COMPARISON
+# ---------------------------
+
+def get_path(doc, path: str):
+    cur = doc
+    for part in path.split("."):
+        if isinstance(cur, dict) and part in cur:
+            cur = cur[part]
+        else:
+            return MISSING
+    return cur
+
+
+def set_path(doc: dict, path: str, value):
+    parts = path.split(".")
+    cur = doc
+    for part in parts[:-1]:
+        nxt = cur.get(part)
+        if not isinstance(nxt, dict):
+            nxt = cur[part] = {}
+        cur = nxt
+    cur[parts[-1]] = value
+
+
+def unset_path(doc: dict, path: str):
+    parts = path.split(".")
+    cur = doc
+    for part in parts[:-1]:
+        cur = cur.get(part)
+        if not isinstance(cur, dict):
+            return
+    cur.pop(parts[-1], None)
+
+
+def _cmp(a, b):
+    """-1/0/1, or None when Mongo wouldn't consider the values comparable."""
+    if a is MISSING or b is MISSING or a is None or b is None:
+        return None
+    try:
+        return (a > b) - (a < b)
+    except TypeError:
+        return None
+
+
+def _eq(value, cond) -> bool:
+    if value is MISSING:
+        return cond is None
+    if isinstance(value, list) and not isinstance(cond, list):
+        return cond in value
+    return value == cond
+
+
+# ---------------------------
+# QUERY MATCHING
+# ---------------------------
+
+def _match_op(value, op: str, arg, doc) -> bool:
+    if op == "$eq":
+        return _eq(value, arg)
+    if op == "$ne":
+        return not _eq(value, arg)
+    if op in ("$gt", "$gte", "$lt", "$lte"):
+        c = _cmp(value, arg)
+        if c is None:
+            return False
+        return {"$gt": c > 0, "$gte": c >= 0, "$lt": c < 0, "$lte": c <= 0}[op]
+    if op == "$in":
+        return any(_eq(value, a) for a in arg)
+    if op == "$nin":
+        return not any(_eq(value, a) for a in arg)
+    if op == "$exists":
+        return (value is not MISSING) == bool(arg)
+    raise NotImplementedError(f"fakemongo: query operator {op}")
+
+
+def match(doc: dict, query: dict) -> bool:
+    for key, cond in (query or {}).items():
+        if key == "$expr":
+            if not evaluate(cond, doc):
+                return False
+        elif key == "$and":
+            if not all(match(doc, q) for q in cond):
+                return False
+        elif key == "$or":
+            if not any(match(doc, q) for q in cond):
+                return False
+        else:
+            value = get_path(doc, key)
+            if isinstance(cond, dict) and cond and all(k.startswith("$") for k in cond):
+                if not all(_match_op(value, op, arg, doc) for op, arg in cond.items()):
+                    return False
+            elif not _eq(value, cond):
+                return False
+    return True
+
+
+# ---------------------------
+# AGGREGATION EXPRESSIONS
+# ---------------------------
+
+def evaluate(expr, doc):
+    if isinstance(expr, str) and expr.startswith("$"):
+        v = get_path(doc, expr[1:])
+        return None if v is MISSING else v
+    if isinstance(expr, list):
+        return [evaluate(e, doc) for e in expr]
+    if not isinstance(expr, dict):
+        return expr
+    if len(expr) != 1 or not next(iter(expr)).startswith("$"):
+        return {k: evaluate(v, doc) for k, v in expr.items()}
+
+    op, arg = next(iter(expr.items()))
+    if op == "$literal":
+        return arg
+    if op == "$cond":
+        if isinstance(arg, dict):
+            arg = [arg["if"], arg["then"], arg["else"]]
+        return evaluate(arg[1], doc) if evaluate(arg[0], doc) else evaluate(arg[2], doc)
+
+    args = [evaluate(a, doc) for a in (arg if isinstance(arg, list) else [arg])]
+    if op == "$ifNull":
+        return next((a for a in args if a is not None), None)
+    if op == "$add":
+        return None if any(a is None for a in args) else sum(args)
+    if op == "$subtract":
+        return None if None in args else args[0] - args[1]
+    if op == "$max":
+        vals = [a for a in args if a is not None]
+        return max(vals) if vals else None
+    if op == "$min":
+        vals = [a for a in args if a is not None]
+        return min(vals) if vals else None
+    if op == "$and":
+        return all(args)
+    if op == "$or":
+        return any(args)
+    if op == "$not":
+        return not args[0]
+    if op in ("$eq", "$ne"):
+        same = args[0] == args[1]
+        return same if op == "$eq" else not same
+    if op in ("$gt", "$gte", "$lt", "$lte"):
+        # aggregation order: null sorts before everything else
+        a, b = args
+        if a is None or b is None:
+            c = (a is not None) - (b is not None)
+        else:
+            c = _cmp(a, b) or 0
+        return {"$gt": c > 0, "$gte": c >= 0, "$lt": c < 0, "$lte": c <= 0}[op]
+    raise NotImplementedError(f"fakemongo: expression operator {op}")
+
+
+# ---------------------------
+# UPDATES
+# ---------------------------
+
+def apply_update(doc: dict, update, inserting: bool = False):
+    if isinstance(update, list):
+        for stage in update:
+            (op, spec), = stage.items()
+            if op in ("$set", "$addFields"):
+                values = {k: evaluate(v, doc) for k, v in spec.items()}
+                for k, v in values.items():
+                    set_path(doc, k, v)
+            elif op == "$unset":
+                for k in ([spec] if isinstance(spec, str) else spec):
+                    unset_path(doc, k)
+            else:
+                raise NotImplementedError(f"fakemongo: pipeline stage {op}")
+        return
+
+    for op, spec in update.items():
+        if op == "$set":
+            for k, v in spec.items():
+                set_path(doc, k, copy.deepcopy(v))
+        elif op == "$setOnInsert":
+            if inserting:
+                for k, v in spec.items():
+                    set_path(doc, k, copy.deepcopy(v))
+        elif op == "$unset":
+            for k in spec:
+                unset_path(doc, k)
+        elif op == "$inc":
+            for k, v in spec.items():
+                cur = get_path(doc, k)
+                set_path(doc, k, (0 if cur is MISSING else cur) + v)
+        elif op in ("$max", "$min"):
+            for k, v in spec.items():
+                cur = get_path(doc, k)
+                c = _cmp(v, cur)
+                if cur is MISSING or (c is not None and (c > 0 if op == "$max" else c < 0)):
+                    set_path(doc, k, v)
+        elif op == "$push":
+            for k, v in spec.items():
+                cur = get_path(doc, k)
+                items = v["$each"] if isinstance(v, dict) and "$each" in v else [v]
+                set_path(doc, k, (list(cur) if isinstance(cur, list) else []) + items)
+        elif op == "$addToSet":
+            for k, v in spec.items():
+                cur = get_path(doc, k)
+                cur = list(cur) if isinstance(cur, list) else []
+                for item in (v["$each"] if isinstance(v, dict) and "$each" in v else [v]):
+                    if item not in cur:
+                        cur.append(item)
+                set_path(doc, k, cur)
+        elif op == "$pull":
+            for k, v in spec.items():
+                cur = get_path(doc, k)
+                if isinstance(cur, list):
+                    set_path(doc, k, [x for x in cur if x != v])
+        else:
+            raise NotImplementedError(f"fakemongo: update operator {op}")
+
+
+def project(doc: dict, projection) -> dict:
+    if not projection:
+        return copy.deepcopy(doc)
+    if isinstance(projection, (list, tuple)):
+        projection = {k: 1 for k in projection}
+    include = {k for k, v in projection.items() if v and k != "_id"}
+    if include:
+        out = {}
+        if projection.get("_id", 1):
+            out["_id"] = doc.get("_id")
+        for k in include:
+            v = get_path(doc, k)
+            if v is not MISSING:
+                set_path(out, k, copy.deepcopy(v))
+        return out
+    out = copy.deepcopy(doc)
+    for k, v in projection.items():
+        if not v:
+            unset_path(out, k)
+    return out
+
+
+def _sort_key(fields):
+    def key(doc):
+        out = []
+        for field, direction in fields:
+            v = get_path(doc, field)
+            v = None if v is MISSING else v
+            out.append(_Ordered(v, direction))
+        return out
+    return key
+
+
+class _Ordered:
+    __slots__ = ("v", "d")
+
+    def __init__(self, v, d):
+        self.v, self.d = v, d
+
+    def __lt__(self, other):
+        a, b = (self.v, other.v) if self.d >= 0 else (other.v, self.v)
+        if a is None or b is None:
+            return a is None and b is not None
+        try:
+            return a < b
+        except TypeError:
+            return str(type(a)) < str(type(b))
+
+    def __eq__(self, other):
+        return self.v == other.v
+
+
+def _normalize_sort(key, direction=None):
+    if isinstance(key, str):
+        return [(key, direction or 1)]
+    return [(k, d) for k, d in key]
+
+
+# ---------------------------
+# CURSOR / COLLECTION
+# ---------------------------
+
+class FakeCursor:
+
+    def __init__(self, col, query, projection):
+        self._col = col
+        self._query = query or {}
+        self._projection = projection
+        self._sort = None
+        self._limit = 0
+        self._skip = 0
+        self._it = None
+
+    def sort(self, key, direction=None):
+        self._sort = _normalize_sort(key, direction)
+        return self
+
+    def limit(self, n: int):
+        self._limit = n
+        return self
+
+    def skip(self, n: int):
+        self._skip = n
+        return self
+
+    def batch_size(self, n: int):
+        return self
+
+    async def _results(self) -> list:
+        await self._col._op("find")
+        docs = self._col._select(self._query)
+        if self._sort:
+            docs.sort(key=_sort_key(self._sort))
+        docs = docs[self._skip:]
+        if self._limit:
+            docs = docs[:self._limit]
+        return [project(d, self._projection) for d in docs]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._it is None:
+            self._it = iter(await self._results())
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def to_list(self, length=None):
+        docs = await self._results()
+        return docs[:length] if length else docs
+
+    async def explain(self):
+        return self._col._explain(self._query, self._sort)
+
+
+class FakeCommandCursor:
+    """Result of aggregate(): already materialized."""
+
+    def __init__(self, docs: list):
+        self._it = iter(docs)
+        self._docs = docs
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def to_list(self, length=None):
+        return self._docs[:length] if length else self._docs
+
+
+def _group(docs: list, spec: dict) -> list:
+    key_expr = spec["_id"]
+    groups: dict = {}
+    for doc in docs:
+        key = evaluate(key_expr, doc)
+        hk = repr(key)
+        if hk not in groups:
+            groups[hk] = {"_id": key, **{f: [] for f in spec if f != "_id"}}
+        for field, acc in spec.items():
+            if field != "_id":
+                (op, expr), = acc.items()
+                groups[hk][field].append(evaluate(expr, doc))
+
+    out = []
+    for g in groups.values():
+        row = {"_id": g["_id"]}
+        for field, acc in spec.items():
+            if field == "_id":
+                continue
+            op = next(iter(acc))
+            vals = g[field]
+            present = [v for v in vals if v is not None]
+            if op == "$sum":
+                row[field] = sum(v for v in present if isinstance(v, (int, float)))
+            elif op == "$push":
+                row[field] = vals
+            elif op == "$first":
+                row[field] = vals[0] if vals else None
+            elif op == "$last":
+                row[field] = vals[-1] if vals else None
+            elif op == "$min":
+                row[field] = min(present) if present else None
+            elif op == "$max":
+                row[field] = max(present) if present else None
+            else:
+                raise NotImplementedError(f"fakemongo: accumulator {op}")
+        out.append(row)
+    return out
+
+
+class FakeCollection:
+
+    def __init__(self, db, name: str):
+        self.database = db
+        self.name = name
+        self._docs: dict = {}               # _id -> doc
+        self._indexes: list[dict] = []      # {"fields": [...], "unique": bool}
+        self._hash: dict[str, dict] = {}    # field -> value -> set(_id)
+
+    # ---- internals ----
+
+    async def _op(self, name: str):
+        self.database.client.ops[(self.name, name)] += 1
+        delay = self.database.client.latency
+        await asyncio.sleep(delay)
+
+    def _hashable(self, v):
+        try:
+            hash(v)
+            return True
+        except TypeError:
+            return False
+
+    def _index_add(self, doc):
+        for field, table in self._hash.items():
+            v = get_path(doc, field)
+            if v is not MISSING and self._hashable(v):
+                table.setdefault(v, set()).add(doc["_id"])
+
+    def _index_remove(self, doc):
+        for field, table in self._hash.items():
+            v = get_path(doc, field)
+            if v is not MISSING and self._hashable(v):
+                ids = table.get(v)
+                if ids:
+                    ids.discard(doc["_id"])
+
+    def _check_unique(self, doc, ignore_id=None):
+        for idx in self._indexes:
+            if not idx["unique"]:
+                continue
+            values = [get_path(doc, f) for f in idx["fields"]]
+            values = [None if v is MISSING else v for v in values]
+            candidates = self._candidates({idx["fields"][0]: values[0]}) if values[0] is not None else self._docs
+            for _id in list(candidates):
+                if _id == ignore_id or _id not in self._docs:
+                    continue
+                other = self._docs[_id]
+                ov = [get_path(other, f) for f in idx["fields"]]
+                if [None if v is MISSING else v for v in ov] == values:
+                    raise DuplicateKeyError(
+                        f"E11000 duplicate key error collection: {self.name} index: {idx['name']}"
+                    )
+
+    def _candidates(self, query: dict):
+        _id = query.get("_id")
+        if _id is not None and not isinstance(_id, dict):
+            return [_id] if _id in self._docs else []
+        for field, cond in query.items():
+            table = self._hash.get(field)
+            if table is None:
+                continue
+            if isinstance(cond, dict):
+                if set(cond) == {"$in"}:
+                    ids = set()
+                    for v in cond["$in"]:
+                        if self._hashable(v):
+                            ids |= table.get(v, set())
+                    return list(ids)
+                continue
+            if cond is None:
+                continue    # {field: None} also matches docs without the field
+            if self._hashable(cond):
+                return list(table.get(cond, ()))
+        return list(self._docs)
+
+    def _select(self, query: dict) -> list:
+        out = []
+        for _id in self._candidates(query or {}):
+            doc = self._docs.get(_id)
+            if doc is not None and match(doc, query):
+                out.append(doc)
+        return out
+
+    def _first(self, query, sort=None):
+        docs = self._select(query)
+        if sort:
+            docs.sort(key=_sort_key(_normalize_sort(sort)))
+        return docs[0] if docs else None
+
+    def _insert(self, doc: dict):
+        doc = copy.deepcopy(doc)
+        doc.setdefault("_id", ObjectId())
+        if doc["_id"] in self._docs:
+            raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} index: _id_")
+        self._check_unique(doc)
+        self._docs[doc["_id"]] = doc
+        self._index_add(doc)
+        return doc
+
+    def _update_doc(self, doc: dict, update, inserting=False):
+        new = copy.deepcopy(doc)
+        apply_update(new, update, inserting=inserting)
+        self._check_unique(new, ignore_id=doc["_id"])
+        self._index_remove(doc)
+        self._docs[doc["_id"]] = new
+        self._index_add(new)
+        return new
+
+    def _upsert(self, query: dict, update):
+        base = {
+            k: v for k, v in query.items()
+            if not k.startswith("$") and not (isinstance(v, dict) and any(x.startswith("$") for x in v))
+        }
+        seed = {}
+        for k, v in base.items():
+            set_path(seed, k, v)
+        seed.setdefault("_id", ObjectId())
+        apply_update(seed, update, inserting=True)
+        return self._insert(seed)
+
+    def _explain(self, query, sort):
+        fields = set(query or {}) | {f for f, _ in (sort or [])}
+        indexed = {"_id"} | {idx["fields"][0] for idx in self._indexes}
+        if fields & indexed or not fields:
+            stage = {"stage": "FETCH", "inputStage": {"stage": "IXSCAN"}} if fields else {"stage": "COLLSCAN"}
+        else:
+            stage = {"stage": "COLLSCAN"}
+        return {"queryPlanner": {"winningPlan": stage}}
+
+    # ---- public API ----
+
+    async def create_indexes(self, models):
+        await self._op("create_indexes")
+        names = []
+        for model in models:
+            spec = model.document
+            fields = list(spec["key"].keys())
+            self._indexes.append({
+                "name": spec["name"],
+                "fields": fields,
+                "unique": bool(spec.get("unique")),
+            })
+            if fields[0] not in self._hash and fields[0] != "_id":
+                table = self._hash[fields[0]] = {}
+                for doc in self._docs.values():
+                    v = get_path(doc, fields[0])
+                    if v is not MISSING and self._hashable(v):
+                        table.setdefault(v, set()).add(doc["_id"])
+            names.append(spec["name"])
+        return names
+
+    async def create_index(self, keys, **kwargs):
+        from pymongo import IndexModel
+        return (await self.create_indexes([IndexModel(keys, **kwargs)]))[0]
+
+    def find(self, filter=None, projection=None, **kwargs):
+        cursor = FakeCursor(self, filter, projection)
+        if kwargs.get("sort"):
+            cursor.sort(kwargs["sort"])
+        if kwargs.get("limit"):
+            cursor.limit(kwargs["limit"])
+        return cursor
+
+    async def find_one(self, filter=None, projection=None, sort=None, **kwargs):
+        await self._op("find_one")
+        doc = self._first(filter or {}, sort)
+        return project(doc, projection) if doc else None
+
+    async def insert_one(self, doc: dict):
+        await self._op("insert_one")
+        stored = self._insert(doc)
+        doc.setdefault("_id", stored["_id"])
+        return SimpleNamespace(inserted_id=stored["_id"], acknowledged=True)
+
+    async def insert_many(self, docs, ordered=True):
+        await self._op("insert_many")
+        ids = []
+        for doc in docs:
+            try:
+                stored = self._insert(doc)
+            except DuplicateKeyError:
+                if ordered:
+                    raise
+                continue
+            doc.setdefault("_id", stored["_id"])
+            ids.append(stored["_id"])
+        return SimpleNamespace(inserted_ids=ids, acknowledged=True)
+
+    async def update_one(self, filter, update, upsert=False, **kwargs):
+        await self._op("update_one")
+        return self._update_one(filter, update, upsert)
+
+    def _update_one(self, filter, update, upsert):
+        doc = self._first(filter)
+        if doc is None:
+            if upsert:
+                new = self._upsert(filter, update)
+                return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=new["_id"])
+            return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=None)
+        self._update_doc(doc, update)
+        return SimpleNamespace(matched_count=1, modified_count=1, upserted_id=None)
+
+    async def update_many(self, filter, update, upsert=False, **kwargs):
+        await self._op("update_many")
+        return self._update_many(filter, update, upsert)
+
+    def _update_many(self, filter, update, upsert):
+        docs = self._select(filter)
+        for doc in docs:
+            self._update_doc(doc, update)
+        if not docs and upsert:
+            new = self._upsert(filter, update)
+            return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=new["_id"])
+        return SimpleNamespace(matched_count=len(docs), modified_count=len(docs), upserted_id=None)
+
+    async def find_one_and_update(self, filter, update, projection=None, sort=None,
+                                  upsert=False, return_document=False, **kwargs):
+        await self._op("find_one_and_update")
+        doc = self._first(filter, sort)
+        if doc is None:
+            if not upsert:
+                return None
+            new = self._upsert(filter, update)
+            return project(new, projection) if return_document else None
+        new = self._update_doc(doc, update)
+        return project(new if return_document else doc, projection)
+
+    async def find_one_and_delete(self, filter, projection=None, sort=None, **kwargs):
+        await self._op("find_one_and_delete")
+        doc = self._first(filter, sort)
+        if doc is None:
+            return None
+        self._index_remove(doc)
+        del self._docs[doc["_id"]]
+        return project(doc, projection)
+
+    async def delete_one(self, filter):
+        await self._op("delete_one")
+        doc = self._first(filter)
+        if doc is None:
+            return SimpleNamespace(deleted_count=0)
+        self._index_remove(doc)
+        del self._docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=1)
+
+    async def delete_many(self, filter):
+        await self._op("delete_many")
+        docs = self._select(filter)
+        for doc in docs:
+            self._index_remove(doc)
+            del self._docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(docs))
+
+    async def drop(self):
+        await self._op("drop")
+        self._docs.clear()
+        self._indexes.clear()
+        self._hash.clear()
+
+    async def count_documents(self, filter, **kwargs):
+        await self._op("count_documents")
+        return len(self._select(filter))
+
+    async def estimated_document_count(self, **kwargs):
+        await self._op("estimated_document_count")
+        return len(self._docs)
+
+    async def bulk_write(self, requests, ordered=True, **kwargs):
+        await self._op("bulk_write")
+        matched = inserted = deleted = 0
+        for req in requests:
+            kind = type(req).__name__
+            try:
+                if kind == "UpdateOne":
+                    matched += self._update_one(req._filter, req._doc, req._upsert).matched_count
+                elif kind == "UpdateMany":
+                    matched += self._update_many(req._filter, req._doc, req._upsert).matched_count
+                elif kind == "InsertOne":
+                    self._insert(req._doc)
+                    inserted += 1
+                elif kind in ("DeleteOne", "DeleteMany"):
+                    docs = self._select(req._filter)
+                    for doc in (docs[:1] if kind == "DeleteOne" else docs):
+                        self._index_remove(doc)
+                        del self._docs[doc["_id"]]
+                        deleted += 1
+                else:
+                    raise NotImplementedError(f"fakemongo: bulk op {kind}")
+            except DuplicateKeyError:
+                if ordered:
+                    raise
+        return SimpleNamespace(
+            matched_count=matched, modified_count=matched,
+            inserted_count=inserted, deleted_count=deleted
+        )
+
+    async def aggregate(self, pipeline: list, **kwargs):
+        await self._op("aggregate")
+        docs = [copy.deepcopy(d) for d in self._docs.values()]
+        for stage in pipeline:
+            (op, arg), = stage.items()
+            if op == "$match":
+                docs = [d for d in docs if match(d, arg)]
+            elif op == "$sort":
+                docs.sort(key=_sort_key(list(arg.items())))
+            elif op == "$group":
+                docs = _group(docs, arg)
+            elif op == "$limit":
+                docs = docs[:arg]
+            elif op == "$project":
+                docs = [project(d, arg) for d in docs]
+            else:
+                raise NotImplementedError(f"fakemongo: aggregation stage {op}")
+        return FakeCommandCursor(docs)
+
+    async def watch(self, *args, **kwargs):
+        await self._op("watch")
+        raise OperationFailure("fakemongo: change streams need a replica set", code=40573)
+
+
+class FakeDatabase:
+
+    def __init__(self, client, name: str):
+        self.client = client
+        self.name = name
+        self._cols: dict[str, FakeCollection] = {}
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        if name not in self._cols:
+            self._cols[name] = FakeCollection(self, name)
+        return self._cols[name]
+
+
+
+class FakeMongoClient:
+    """Drop-in for pymongo.AsyncMongoClient (see bench.harness.load_bot)."""
+
+    latency = 0.0
+
+    def __init__(self, *args, **kwargs):
+        self.ops: Counter = Counter()
+        self._dbs: dict[str, FakeDatabase] = {}
+
+    def __getitem__(self, name: str) -> FakeDatabase:
+        if name not in self._dbs:
+            self._dbs[name] = FakeDatabase(self, name)
+        return self._dbs[name]
+
+    def total_ops(self) -> int:
+        return sum(self.ops.values())
+
+    async def close(self):
+        pass
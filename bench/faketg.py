@@ -0,0 +1,310 @@
+"""
+In-process stand-in for the Pyrogram Client API used by bot.py.
+
+Every API call sleeps for a configurable latency (plus jitter) and can
+raise FloodWait with a given probability, so rate limiting and retry
+paths get exercised. Updates (messages, callback queries) are plain
+objects whose bound methods go through the same fake client.
+"""
+
+import asyncio
+import itertools
+import random
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from pyrogram import StopPropagation, ContinuePropagation
+from pyrogram.enums import ChatType
+from pyrogram.errors import FloodWait
+
+# methods that Telegram throttles hard enough to be worth injecting FloodWait into
+FLOOD_METHODS = {
+    "send_message", "send_photo", "copy_message", "copy_media_group",
+    "forward_messages", "delete_messages",
+}
+
+
+class FakeUser(SimpleNamespace):
+    pass
+
+
+class FakeChat(SimpleNamespace):
+    pass
+
+
+class FakePhoto(SimpleNamespace):
+    pass
+
+
+class FakeMessage:
+
+    def __init__(self, client, chat_id: int, id: int, from_user=None, text=None,
+                 caption=None, photo=None, reply_to_message=None, media_group_id=None,
+                 video=None, date=None):
+        self._client = client
+        self.id = id
+        chat_type = ChatType.CHANNEL if chat_id < 0 else ChatType.PRIVATE
+        self.chat = FakeChat(id=chat_id, type=chat_type, username=None)
+        self.from_user = from_user
+        self.text = text
+        self.caption = caption
+        self.photo = photo
+        self.video = video
+        self.reply_to_message = reply_to_message
+        self.media_group_id = media_group_id
+        self.date = date
+        self.empty = False
+        self.service = None
+        self.command = text[1:].split() if text and text.startswith("/") else None
+        self.outgoing = False
+
+    def stop_propagation(self):
+        raise StopPropagation
+
+    def continue_propagation(self):
+        raise ContinuePropagation
+
+    async def reply(self, text, **kwargs):
+        return await self._client.send_message(self.chat.id, text, **kwargs)
+
+    async def reply_document(self, document, **kwargs):
+        return await self._client.send_document(self.chat.id, document, **kwargs)
+
+    async def edit_text(self, text, **kwargs):
+        return await self._client.edit_message_text(self.chat.id, self.id, text, **kwargs)
+
+    async def edit_caption(self, caption, **kwargs):
+        return await self._client.edit_message_caption(self.chat.id, self.id, caption, **kwargs)
+
+    async def edit_reply_markup(self, reply_markup=None):
+        return await self._client.edit_message_reply_markup(self.chat.id, self.id, reply_markup)
+
+    async def edit_media(self, media, **kwargs):
+        return await self._client.edit_message_media(self.chat.id, self.id, media, **kwargs)
+
+    async def delete(self):
+        return await self._client.delete_messages(self.chat.id, self.id)
+
+    async def copy(self, chat_id, **kwargs):
+        return await self._client.copy_message(chat_id, self.chat.id, self.id, **kwargs)
+
+
+class FakeCallbackQuery:
+
+    def __init__(self, client, user, data: str, message: FakeMessage):
+        self._client = client
+        self.id = str(next(client._ids))
+        self.from_user = user
+        self.data = data
+        self.message = message
+
+    async def answer(self, text=None, show_alert=False, **kwargs):
+        return await self._client.answer_callback_query(self.id, text, show_alert=show_alert)
+
+
+class FakeTelegram:
+    """
+    Drop-in for pyrogram.Client. Handlers registered through on_message /
+    on_callback_query are only recorded; the harness calls them directly.
+    """
+
+    _bot_ids = itertools.count(1)
+
+    def __init__(self, name=None, *args, **kwargs):
+        self.name = name
+        self.handlers = []
+        n = next(FakeTelegram._bot_ids)
+        self.me = FakeUser(id=n, username=f"bench_bot{n}", is_bot=True)
+        self.latency = 0.0
+        self.jitter = 0.0
+        self.flood_rate = 0.0
+        self.flood_seconds = 1
+        self.calls: Counter = Counter()
+        self.channel_posts: dict[int, int] = {}   # chat_id -> last existing message id
+        self.flood_waits: Counter = Counter()
+        self.call_time = defaultdict(float)
+        self._ids = itertools.count(1000)
+        self._rng = random.Random(0)
+        # Pyrogram runs sync filters (filters.create with a plain function)
+        # via client.loop.run_in_executor(client.executor, ...)
+        self.executor = ThreadPoolExecutor(4, thread_name_prefix="Handler")
+
+    @property
+    def loop(self):
+        return asyncio.get_running_loop()
+
+    def configure(self, latency=0.0, jitter=0.0, flood_rate=0.0, flood_seconds=1, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.flood_rate = flood_rate
+        self.flood_seconds = flood_seconds
+        self._rng = random.Random(seed)
+
+    # ---- handler registration ----
+
+    def on_message(self, filters=None, group=0):
+        def decorator(func):
+            self.handlers.append(("message", filters, group, func))
+            return func
+        return decorator
+
+    def on_callback_query(self, filters=None, group=0):
+        def decorator(func):
+            self.handlers.append(("callback_query", filters, group, func))
+            return func
+        return decorator
+
+    def on_deleted_messages(self, filters=None, group=0):
+        def decorator(func):
+            self.handlers.append(("deleted_messages", filters, group, func))
+            return func
+        return decorator
+
+    def add_handler(self, handler, group=0):
+        kind = {
+            "MessageHandler": "message",
+            "CallbackQueryHandler": "callback_query",
+            "DeletedMessagesHandler": "deleted_messages",
+        }.get(type(handler).__name__, "raw")
+        self.handlers.append((kind, handler.filters, group, handler.callback))
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        return self
+
+    async def dispatch(self, kind: str, update, unwrap: bool = False) -> bool:
+        """
+        Route an update the way Pyrogram does: groups in ascending order,
+        the first handler whose filters match runs in each group. With
+        `unwrap`, decorators (per_user, timed) are skipped and the handler
+        body runs inline. Returns whether any handler ran.
+        """
+        handled = False
+        by_group = sorted(
+            (h for h in self.handlers if h[0] == kind), key=lambda h: h[2]
+        )
+        for group, handlers in itertools.groupby(by_group, key=lambda h: h[2]):
+            for _, flt, _, func in handlers:
+                if flt is not None and not await flt(self, update):
+                    continue
+                if unwrap:
+                    func = getattr(func, "__wrapped__", func)
+                try:
+                    await func(self, update)
+                except StopPropagation:
+                    return True
+                except ContinuePropagation:
+                    continue
+                handled = True
+                break
+        return handled
+
+    # ---- update factories ----
+
+    def message(self, user_id: int, text=None, photo=None, username=None, reply_to=None) -> FakeMessage:
+        user = FakeUser(id=user_id, username=username or f"user{user_id}", is_bot=False)
+        if photo:
+            n = next(self._ids)
+            photo = FakePhoto(file_id=f"photo-{n}", file_unique_id=f"uniq-{n}")
+        return FakeMessage(
+            self, user_id, next(self._ids), from_user=user, text=text,
+            photo=photo, reply_to_message=reply_to, date=time.time()
+        )
+
+    def callback(self, user_id: int, data: str, username=None) -> FakeCallbackQuery:
+        user = FakeUser(id=user_id, username=username or f"user{user_id}", is_bot=False)
+        msg = FakeMessage(self, user_id, next(self._ids), caption="menu")
+        return FakeCallbackQuery(self, user, data, msg)
+
+    # ---- API ----
+
+    async def _call(self, method: str):
+        self.calls[method] += 1
+        delay = self.latency
+        if self.jitter:
+            delay += self._rng.uniform(0, self.jitter)
+        t0 = time.perf_counter()
+        await asyncio.sleep(delay)
+        self.call_time[method] += time.perf_counter() - t0
+        if method in FLOOD_METHODS and self.flood_rate and self._rng.random() < self.flood_rate:
+            self.flood_waits[method] += 1
+            raise FloodWait(value=self.flood_seconds)
+
+    def _sent(self, chat_id: int, **kwargs) -> FakeMessage:
+        return FakeMessage(self, chat_id, next(self._ids), **kwargs)
+
+    async def send_message(self, chat_id, text, **kwargs):
+        await self._call("send_message")
+        return self._sent(chat_id, text=text)
+
+    async def send_photo(self, chat_id, photo, caption=None, **kwargs):
+        await self._call("send_photo")
+        n = next(self._ids)
+        return self._sent(chat_id, caption=caption,
+                          photo=FakePhoto(file_id=f"photo-{n}", file_unique_id=f"uniq-{n}"))
+
+    async def send_document(self, chat_id, document, **kwargs):
+        await self._call("send_document")
+        return self._sent(chat_id, caption=kwargs.get("caption"))
+
+    async def send_media_group(self, chat_id, media, **kwargs):
+        await self._call("send_media_group")
+        return [self._sent(chat_id) for _ in media]
+
+    async def copy_message(self, chat_id, from_chat_id, message_id, **kwargs):
+        await self._call("copy_message")
+        return self._sent(chat_id, caption=kwargs.get("caption"))
+
+    async def copy_media_group(self, chat_id, from_chat_id, message_id, **kwargs):
+        await self._call("copy_media_group")
+        return [self._sent(chat_id)]
+
+    async def forward_messages(self, chat_id, from_chat_id, message_ids, **kwargs):
+        await self._call("forward_messages")
+        if isinstance(message_ids, int):
+            return self._sent(chat_id)
+        return [self._sent(chat_id) for _ in message_ids]
+
+    def _stored(self, chat_id, message_id) -> FakeMessage:
+        last = self.channel_posts.get(chat_id)
+        if last is not None and message_id > last:
+            msg = FakeMessage(self, chat_id, message_id)
+            msg.empty = True
+            return msg
+        return FakeMessage(self, chat_id, message_id, video=FakePhoto(file_id="v"))
+
+    async def get_messages(self, chat_id, message_ids=None, **kwargs):
+        await self._call("get_messages")
+        if isinstance(message_ids, int):
+            return self._stored(chat_id, message_ids)
+        return [self._stored(chat_id, m) for m in message_ids]
+
+    async def delete_messages(self, chat_id, message_ids, **kwargs):
+        await self._call("delete_messages")
+        return 1 if isinstance(message_ids, int) else len(message_ids)
+
+    async def edit_message_text(self, chat_id, message_id, text, **kwargs):
+        await self._call("edit_message_text")
+        return FakeMessage(self, chat_id, message_id, text=text)
+
+    async def edit_message_caption(self, chat_id, message_id, caption, **kwargs):
+        await self._call("edit_message_caption")
+        return FakeMessage(self, chat_id, message_id, caption=caption)
+
+    async def edit_message_reply_markup(self, chat_id, message_id, reply_markup=None):
+        await self._call("edit_message_reply_markup")
+        return FakeMessage(self, chat_id, message_id)
+
+    async def edit_message_media(self, chat_id, message_id, media, **kwargs):
+        await self._call("edit_message_media")
+        n = next(self._ids)
+        return FakeMessage(self, chat_id, message_id,
+                           photo=FakePhoto(file_id=f"photo-{n}", file_unique_id=f"uniq-{n}"))
+
+    async def answer_callback_query(self, callback_query_id, text=None, show_alert=False, **kwargs):
+        await self._call("answer_callback_query")
+        return True
@@ -0,0 +1,315 @@
+"""
+Scenario driver: seeds the fake backends, runs bot.py handlers with
+synthetic updates from many concurrent virtual users and collects
+latency / throughput / DB-op numbers.
+"""
+
+import asyncio
+import importlib
+import itertools
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from bench.fakemongo import FakeMongoClient
+from bench.faketg import FakeTelegram
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+USER_BASE = 10_000_000          # seeded users: USER_BASE + i
+NEW_USER_BASE = 90_000_000      # /start scenario registers fresh users from here
+
+
+def load_bot(env: dict | None = None):
+    """
+    Import bot.py with pyrogram.Client and pymongo.AsyncMongoClient
+    replaced by the fakes. Must run before anything else imports bot.
+    """
+    if "bot" in sys.modules:
+        return sys.modules["bot"]
+
+    for key, value in (env or {}).items():
+        os.environ[key] = str(value)
+
+    import pyrogram
+    import pymongo
+    pyrogram.Client = FakeTelegram
+    pymongo.AsyncMongoClient = FakeMongoClient
+
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    bot = importlib.import_module("bot")
+    # no network: the media cache "downloads" a deterministic blob
+    bot._download = lambda url: b"bench-asset:" + url.encode()
+    return bot
+
+
+def percentile(sorted_vals: list, p: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = min(len(sorted_vals) - 1, max(0, round(p / 100 * (len(sorted_vals) - 1))))
+    return sorted_vals[k]
+
+
+def git_rev() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+class Bench:
+
+    def __init__(self, bot, users: int = 10_000, content: int = 5_000,
+                 concurrency: int = 200, seed: int = 0):
+        self.bot = bot
+        self.app = bot.app
+        self.mongo = bot.mongo
+        self.users = users
+        self.content = content
+        self.concurrency = concurrency
+        self.seed = seed
+        self._bg_tasks = set()
+        self._codes = []
+
+    # ---- setup ----
+
+    def user_doc(self, user_id: int) -> dict:
+        """A registered user who already claimed today's bonus and pressed Submit Payment."""
+        bot = self.bot
+        return {
+            "user_id": user_id,
+            "username": f"user{user_id}",
+            "daily_limit": bot.DONATION_DAILY_LIMIT,
+            **bot.usage_reset(),
+            "last_bonus_date": bot.today_str(),
+            "premium": False,
+            "premium_until": None,
+            "payment_armed_until": bot.now_ist() + bot.timedelta(days=1),
+            "joined_at": bot.now_ist(),
+            "last_active": bot.now_ist(),
+        }
+
+    async def setup(self, codes: int = 0):
+        bot = self.bot
+        # seeded straight into the fakes: no latency, not counted as ops
+        for i in range(self.users):
+            bot.users_col._insert(self.user_doc(USER_BASE + i))
+        bot.users_col._insert(self.user_doc(bot.OWNER_ID))
+        for i in range(self.content):
+            bot.content_col._insert({
+                "channel_id": bot.DB_CHANNEL_ID, "message_id": i + 1, "valid": True, "seq": i + 1
+            })
+        for i in range(codes):
+            code = f"BENCH-{i:08d}"
+            self._codes.append(code)
+            bot.codes_col._insert({
+                "code": code, "videos": 10, "days": 7, "used": False,
+                "created_at": bot.now_ist()
+            })
+
+        self.app.channel_posts[bot.DB_CHANNEL_ID] = self.content
+
+        await bot.run_migrations()      # main() runs these before app.start()
+        before = asyncio.all_tasks()
+        await bot.on_startup()
+        self._bg_tasks = asyncio.all_tasks() - before
+
+    async def teardown(self):
+        # same path as a SIGTERM: drain hooks (incl. write-behind flush), then cancel
+        await self.bot.runtime.drain(5)
+        for task in self._bg_tasks:
+            task.cancel()
+        await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
+    # ---- updates ----
+
+    def _handler(self, func):
+        # per_user-wrapped handlers return before the work is done;
+        # benchmark the wrapped function so latency covers the whole handler
+        return getattr(func, "__wrapped__", func)
+
+    async def callback(self, user_id: int, data: str):
+        cb = self.app.callback(user_id, data)
+        await self._handler(self.bot.callback_router)(self.app, cb)
+
+    async def message(self, handler, user_id: int, text=None, photo=False):
+        msg = self.app.message(user_id, text=text, photo=photo)
+        await self._handler(handler)(self.app, msg)
+
+    def make_update(self, scenario: str, i: int):
+        bot = self.bot
+        uid = USER_BASE + (i % self.users)
+
+        if scenario == "start":
+            return self.message(bot.start_command, NEW_USER_BASE + i, "/start")
+        if scenario == "menu":
+            data = ("profile", "increase_limit", "back_menu")[i % 3]
+            return self.callback(uid, data)
+        if scenario == "bonus":
+            return self.callback(uid, "daily_bonus")
+        if scenario == "next":
+            return self.callback(uid, "next_video")
+        if scenario == "next5":
+            return self.callback(uid, "next_batch:5")
+        if scenario == "payment":
+            return self.message(bot.receive_payment_ss, uid, photo=True)
+        if scenario == "redeem":
+            code = self._codes[i % len(self._codes)] if self._codes else "NOPE"
+            return self.message(bot.redeem_code, uid, f"/redeem {code}")
+        raise ValueError(f"unknown scenario {scenario}")
+
+    # ---- runs ----
+
+    def _tg_counters(self) -> tuple[Counter, Counter]:
+        calls, fws = Counter(), Counter()
+        for s in self.bot.sender_pool.senders:      # app + helper bots
+            calls.update(s.client.calls)
+            fws.update(s.client.flood_waits)
+        return calls, fws
+
+    def _snapshot(self):
+        return (Counter(self.mongo.ops), *self._tg_counters())
+
+    def _result(self, updates: int, duration: float, latencies: list, errors: int, snap) -> dict:
+        ops0, calls0, fw0 = snap
+        ops = Counter(self.mongo.ops)
+        ops.subtract(ops0)
+        calls, fws = self._tg_counters()
+        calls.subtract(calls0)
+        fws.subtract(fw0)
+
+        lat = sorted(x * 1000 for x in latencies)
+        per = max(updates, 1)
+        return {
+            "updates": updates,
+            "errors": errors,
+            "duration_s": round(duration, 4),
+            "updates_per_sec": round(updates / duration, 2) if duration else None,
+            "latency_ms": {
+                "p50": round(percentile(lat, 50), 3),
+                "p90": round(percentile(lat, 90), 3),
+                "p99": round(percentile(lat, 99), 3),
+                "max": round(lat[-1], 3) if lat else 0.0,
+                "mean": round(sum(lat) / len(lat), 3) if lat else 0.0,
+            },
+            "db_ops_per_update": round(sum(ops.values()) / per, 3),
+            "db_ops": {f"{c}.{op}": n for (c, op), n in sorted(ops.items()) if n},
+            "tg_calls_per_update": round(sum(calls.values()) / per, 3),
+            "tg_calls": {m: n for m, n in sorted(calls.items()) if n},
+            "flood_waits": {m: n for m, n in sorted(fws.items()) if n},
+        }
+
+    async def run_scenario(self, scenario: str, updates: int) -> dict:
+        if scenario == "broadcast":
+            return await self.run_broadcast()
+
+        snap = self._snapshot()
+        counter = itertools.count()
+        latencies = []
+        errors = 0
+        first_error = None
+
+        async def worker():
+            nonlocal errors, first_error
+            while True:
+                i = next(counter)
+                if i >= updates:
+                    return
+                t0 = time.perf_counter()
+                try:
+                    await self.make_update(scenario, i)
+                except Exception as e:
+                    errors += 1
+                    first_error = first_error or repr(e)
+                latencies.append(time.perf_counter() - t0)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, updates))))
+        duration = time.perf_counter() - started
+
+        result = self._result(updates, duration, latencies, errors, snap)
+        if first_error:
+            result["first_error"] = first_error
+        return result
+
+    async def run_broadcast(self) -> dict:
+        bot = self.bot
+        snap = self._snapshot()
+        source = self.app.message(bot.OWNER_ID, text="hello everyone")
+        cmd = self.app.message(bot.OWNER_ID, text="/broadcast", reply_to=source)
+
+        started = time.perf_counter()
+        await self._handler(bot.broadcast_all)(self.app, cmd)
+        while bot.broadcaster.tasks:
+            await asyncio.sleep(0.05)
+        duration = time.perf_counter() - started
+
+        b = await bot.broadcasts_col.find_one({}, sort=[("_id", -1)])
+        delivered = b["sent"] + b["failed"] + b["blocked"]
+        result = self._result(delivered, duration, [duration], 0, snap)
+        result["recipients"] = b["total"]
+        result["sent"] = b["sent"]
+        result["messages_per_sec"] = round(delivered / duration, 2) if duration else None
+        return result
+
+
+def boot(config: dict):
+    """Load bot.py on the fakes and apply the backend options from the CLI."""
+    env = {
+        # senders are rate limited in production; the bench measures the code path
+        "BROADCAST_RATE": config["broadcast_rate"],
+        "LOG_GROUP_RATE": 1000,
+        "NOTIFY_RATE": 1000,
+        "METRICS_PORT": 0,
+        "SENDER_RATE": config["sender_rate"],
+        "HELPER_BOT_TOKENS": ",".join(f"bench-helper-{i}" for i in range(config["helpers"])),
+    }
+    bot = load_bot(env)
+    bot.logger.setLevel(config.get("log_level", "WARNING"))
+    for i, sender in enumerate(bot.sender_pool.senders):
+        sender.client.configure(
+            latency=config["tg_latency_ms"] / 1000,
+            jitter=config["tg_jitter_ms"] / 1000,
+            flood_rate=config["flood_rate"],
+            flood_seconds=config["flood_seconds"],
+            seed=config["seed"] + i,
+        )
+    FakeMongoClient.latency = config["db_latency_ms"] / 1000
+    return bot
+
+
+def meta(config: dict) -> dict:
+    return {
+        "git_rev": git_rev(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "config": config,
+    }
+
+
+async def run(config: dict) -> dict:
+    bot = boot(config)
+    bench = Bench(
+        bot,
+        users=config["users"],
+        content=config["content"],
+        concurrency=config["concurrency"],
+        seed=config["seed"],
+    )
+    scenarios = config["scenarios"]
+    await bench.setup(codes=config["updates"] if "redeem" in scenarios else 0)
+
+    results = {}
+    try:
+        for name in scenarios:
+            results[name] = await bench.run_scenario(name, config["updates"])
+    finally:
+        await bench.teardown()
+
+    return {"meta": meta(config), "scenarios": results}
@@ -0,0 +1,311 @@
+"""
+Replays an update log recorded by bot.py (UPDATE_LOG_DIR) through the
+real handlers against the fake backends, at the recorded pace or faster,
+and reports latency per handler plus DB ops / Telegram calls per update.
+
+    python -m bench.replay logs/updates-20261018-19.jsonl.gz --speed 10
+
+Users seen in the log are seeded as registered users, except those whose
+first update is /start (they register during the replay). The recorded
+owner and DB channel ids are mapped onto the ones bot.py is configured with.
+
+Updates go through the wrapped handlers, so per_user lanes order each
+user's updates exactly as in production; an update's latency runs until
+its lane job finishes (queue wait included). At --speed 0 a user's next
+update is only dispatched once the previous one is done, so replays are
+deterministic per user and backpressure doesn't drop anything.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import time
+from collections import defaultdict
+
+from bench.__main__ import add_backend_args, print_table
+from bench.faketg import FakeMessage, FakePhoto, FakeUser
+from bench.harness import Bench, boot, meta, percentile
+
+LOG_VERSION = 1
+
+
+def read_log(paths: list[str]) -> tuple[dict, list[dict]]:
+    """Header of the first file + all records, oldest first."""
+    header, records = {}, []
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                if rec["k"] != "h":
+                    records.append(rec)
+                    continue
+                if rec["v"] > LOG_VERSION:
+                    raise SystemExit(f"{path}: log version {rec['v']} is newer than this replayer")
+                header = header or rec
+    records.sort(key=lambda r: r["t"])
+    return header, records
+
+
+def label(rec: dict) -> str:
+    """Bucket for the per-handler table: command, callback action or message kind."""
+    if rec["k"] == "c":
+        return "cb:" + rec["d"].split(":", 1)[0]
+    if "x" in rec:
+        return rec["x"].split(maxsplit=1)[0].split("@")[0].lower()
+    if rec.get("channel"):
+        return "channel_post"
+    if "p" in rec:
+        return "photo"
+    return "text"
+
+
+class Replay:
+
+    def __init__(self, bench: Bench, header: dict, records: list[dict],
+                 speed: float, concurrency: int):
+        self.bench = bench
+        self.bot = bench.bot
+        self.app = bench.app
+        self.records = records
+        self.speed = speed
+        self.concurrency = concurrency
+
+        bot = self.bot
+        self.ids = {}
+        if header.get("owner"):
+            self.ids[header["owner"]] = bot.OWNER_ID
+        if header.get("db_channel"):
+            self.ids[header["db_channel"]] = bot.DB_CHANNEL_ID
+
+        # channel posts get fresh ids right after the seeded content
+        self.posts = 0
+        for rec in records:
+            rec["u"] = self.ids.get(rec.get("u"), rec.get("u"))
+            if rec["k"] == "m":
+                rec["c"] = self.ids.get(rec["c"], rec["c"])
+                if rec["c"] == bot.DB_CHANNEL_ID:
+                    self.posts += 1
+                    rec["channel"] = True
+                    rec["i"] = bench.content + self.posts
+
+        self.latency = defaultdict(list)
+        self.lag = []
+        self.errors = 0
+        self.first_error = None
+        self.unhandled = 0
+        self.dropped = 0
+        self._waiting: dict[int, asyncio.Future] = {}    # id(update) -> lane job done
+        self._user_locks: dict = defaultdict(asyncio.Lock)
+
+    def _track_dispatcher(self):
+        """Wrap dispatcher.submit so each replayed update reports when its job ends."""
+        dispatcher = self.bot.dispatcher
+        submit = dispatcher.submit
+
+        def tracked_submit(user_id, key, job):
+            fut = self._waiting.pop(id(job.args[-1]), None)
+            if fut is None:
+                return submit(user_id, key, job)
+
+            async def run():
+                try:
+                    await job()
+                except Exception as e:
+                    self.errors += 1
+                    self.first_error = self.first_error or repr(e)
+                    raise
+                finally:
+                    if not fut.done():
+                        fut.set_result(None)
+
+            ok = submit(user_id, key, run)
+            if not ok:
+                self.dropped += 1
+                fut.set_result(None)
+            return ok
+
+        dispatcher.submit = tracked_submit
+
+    def seed_users(self):
+        first = {}
+        for rec in self.records:
+            uid = rec.get("u")
+            if uid is not None and not rec.get("channel") and uid not in first:
+                first[uid] = rec
+        seeded = 0
+        for uid, rec in first.items():
+            if uid == self.bot.OWNER_ID or rec.get("x", "").startswith("/start"):
+                continue
+            doc = self.bench.user_doc(uid)
+            doc.pop("payment_armed_until", None)   # the log has the real Submit presses
+            if rec.get("n"):
+                doc["username"] = rec["n"]
+            self.bot.users_col._insert(doc)
+            seeded += 1
+        return seeded
+
+    def build(self, rec: dict) -> tuple[str, object]:
+        app = self.app
+        if rec["k"] == "c":
+            return "callback_query", app.callback(rec["u"], rec["d"], username=rec.get("n"))
+
+        user = None
+        if rec.get("u") is not None:
+            user = FakeUser(id=rec["u"], username=rec.get("n"), is_bot=False)
+        text = rec.get("x") or ("x" * rec["l"] if rec.get("l") else None)
+        photo = None
+        if rec.get("p"):
+            photo = FakePhoto(file_id=f"replay-{rec['p']}", file_unique_id=rec["p"])
+        reply_to = None
+        if rec.get("r"):
+            reply_to = FakeMessage(app, rec["c"], rec["r"], text="replayed")
+        msg = FakeMessage(
+            app, rec["c"], rec["i"], from_user=user, text=text, photo=photo,
+            video=FakePhoto(file_id=f"replay-video-{rec['i']}") if rec.get("v") else None,
+            reply_to_message=reply_to, date=rec["t"],
+        )
+        return "message", msg
+
+    async def _one(self, rec: dict, scheduled: float, sem: asyncio.Semaphore):
+        # --speed 0: one update per user at a time, in recorded order (Lock is FIFO)
+        ordered = self._user_locks[rec.get("u")] if self.speed <= 0 else None
+        if ordered is not None:
+            await ordered.acquire()
+        try:
+            async with sem:
+                await self._dispatch(rec, scheduled)
+        finally:
+            if ordered is not None:
+                ordered.release()
+
+    async def _dispatch(self, rec: dict, scheduled: float):
+        kind, update = self.build(rec)
+        done = asyncio.get_running_loop().create_future()
+        self._waiting[id(update)] = done
+        t0 = time.perf_counter()
+        self.lag.append(max(0.0, t0 - scheduled))
+        try:
+            if not await self.app.dispatch(kind, update, unwrap=False):
+                self.unhandled += 1
+        except Exception as e:
+            self.errors += 1
+            self.first_error = self.first_error or repr(e)
+        if self._waiting.pop(id(update), None) is None:
+            await done      # went into a per_user lane
+        self.latency[label(rec)].append(time.perf_counter() - t0)
+
+    async def run(self) -> dict:
+        bench = self.bench
+        self._track_dispatcher()
+        snap = bench._snapshot()
+        sem = asyncio.Semaphore(self.concurrency)
+        tasks = []
+        first = self.records[0]["t"] if self.records else 0.0
+
+        started = time.perf_counter()
+        for rec in self.records:
+            scheduled = started
+            if self.speed > 0:
+                scheduled += (rec["t"] - first) / self.speed
+                wait = scheduled - time.perf_counter()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            tasks.append(asyncio.create_task(self._one(rec, scheduled, sem)))
+        await asyncio.gather(*tasks)
+        while self.bot.dispatcher.stats()["active_users"] or self.bot.broadcaster.tasks:
+            await asyncio.sleep(0.05)
+        duration = time.perf_counter() - started
+
+        latencies = [x for lat in self.latency.values() for x in lat]
+        result = bench._result(len(self.records), duration, latencies, self.errors, snap)
+        if self.first_error:
+            result["first_error"] = self.first_error
+        lag = sorted(x * 1000 for x in self.lag)
+        result["unhandled"] = self.unhandled
+        result["dropped"] = self.dropped
+        result["schedule_lag_ms"] = {
+            "p99": round(percentile(lag, 99), 3),
+            "max": round(lag[-1], 3) if lag else 0.0,
+        }
+        result["handlers"] = {}
+        for name, lat in sorted(self.latency.items(), key=lambda kv: -len(kv[1])):
+            lat = sorted(x * 1000 for x in lat)
+            result["handlers"][name] = {
+                "count": len(lat),
+                "p50": round(percentile(lat, 50), 3),
+                "p90": round(percentile(lat, 90), 3),
+                "p99": round(percentile(lat, 99), 3),
+                "max": round(lat[-1], 3),
+            }
+        return result
+
+
+async def replay(config: dict) -> dict:
+    header, records = read_log(config["logs"])
+    if not records:
+        raise SystemExit("no updates in log")
+    bot = boot(config)
+    bench = Bench(bot, users=0, content=config["content"], concurrency=config["concurrency"],
+                  seed=config["seed"])
+    rep = Replay(bench, header, records, config["speed"], config["concurrency"])
+    seeded = rep.seed_users()
+
+    await bench.setup()
+    # recorded channel posts exist from here on (setup's backfill saw only the seeded ones)
+    bench.app.channel_posts[bot.DB_CHANNEL_ID] = bench.content + rep.posts
+    try:
+        result = await rep.run()
+    finally:
+        await bench.teardown()
+
+    result["seeded_users"] = seeded
+    result["log_span_s"] = round(records[-1]["t"] - records[0]["t"], 3)
+    return {"meta": meta(config), "scenarios": {"replay": result}}
+
+
+def print_handlers(result: dict):
+    print(f"\n{'handler':<22} {'count':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, h in result["handlers"].items():
+        print(f"{name:<22} {h['count']:>7} {h['p50']:>9.2f} {h['p90']:>9.2f} "
+              f"{h['p99']:>9.2f} {h['max']:>9.2f}")
+    lag = result["schedule_lag_ms"]
+    print(f"\nunhandled: {result['unhandled']}, dropped by per-user backpressure: "
+          f"{result['dropped']}, schedule lag p99 {lag['p99']:.1f} ms "
+          f"(max {lag['max']:.1f} ms), log span {result['log_span_s']}s")
+    if "first_error" in result:
+        print(f"first error: {result['first_error']}")
+
+
+def parse_args(argv=None) -> dict:
+    p = argparse.ArgumentParser(prog="python -m bench.replay",
+                                description="replay a recorded update log against bot.py")
+    p.add_argument("logs", nargs="+", help="updates-*.jsonl.gz files (UPDATE_LOG_DIR)")
+    p.add_argument("--speed", type=float, default=1.0,
+                   help="1 = recorded pace, 10 = 10x faster, 0 = as fast as possible")
+    p.add_argument("--concurrency", type=int, default=1000, help="updates in flight at most")
+    add_backend_args(p)
+    return vars(p.parse_args(argv))
+
+
+def main(argv=None):
+    config = parse_args(argv)
+    json_path = config.pop("json_path")
+    results = asyncio.run(replay(config))
+    print_table(results)
+    print_handlers(results["scenarios"]["replay"])
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"results written to {json_path}")
+    errors = results["scenarios"]["replay"]["errors"]
+    if errors:
+        # a crashing filter/handler is a replay bug, not a latency number
+        raise SystemExit(f"replay failed: {errors} update(s) raised")
+
+
+if __name__ == "__main__":
+    main()